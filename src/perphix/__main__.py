@@ -4,16 +4,18 @@ from pathlib import Path
 from rich.logging import RichHandler
 from typing import Optional
 
+# Create the handler once at import; cli() only has to install it on a bare root logger.
+_handler = RichHandler(rich_tracebacks=True)
+_handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+
 
 @click.group()
 def cli():
     """Perphix CLI"""
-    logging.basicConfig(
-        level="NOTSET",
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[RichHandler(rich_tracebacks=True)],
-    )
+    root = logging.getLogger()
+    if not root.handlers:
+        root.addHandler(_handler)
+        root.setLevel(logging.NOTSET)
 
 
 @cli.command()
@@ -1,6 +1,6 @@
 """The Perphix dataset"""
 from typing import List, Tuple, Dict, Union, Optional, Any
-import copy
+import sys
 import pycocotools.mask as mask_util
 import numpy as np
 import cv2
@@ -11,6 +11,14 @@ import datetime
 log = logging.getLogger(__name__)
 
 
+def _by_id(categories: list[dict]) -> tuple:
+    """Pack categories into a tuple indexed by their (small, dense) integer ids."""
+    out = [None] * (max(cat["id"] for cat in categories) + 1)
+    for cat in categories:
+        out[cat["id"]] = cat
+    return tuple(out)
+
+
 class PerphixBase:
     """A base class for Perphix datasets.
 
@@ -260,19 +268,32 @@ class PerphixBase:
     _annotation_labels: dict[int, str] = dict(
         (i, ann["name"]) for i, ann in enumerate(_base_categories)
     )
+    _annotation_from_name = dict((ann["name"], ann) for ann in _base_categories)
+    # Category ids are dense, so id-keyed lookups index a tuple instead of hashing.
+    _cat_by_id = _by_id(_base_categories)
+    _cat_name_by_id = tuple(cat["name"] if cat is not None else None for cat in _cat_by_id)
+
+    # Structure-of-arrays views over the categories, for bulk NumPy filtering/mapping.
+    _cat_ids = np.fromiter((ann["id"] for ann in _base_categories), int)
+    _cat_names = np.array([ann["name"] for ann in _base_categories], dtype=object)
+    _cat_supercategories = np.array(
+        [ann["supercategory"] for ann in _base_categories], dtype=object
+    )
+    _catids_by_supercategory = {
+        "instrument": _cat_ids[_cat_supercategories == "instrument"],
+        "patient": _cat_ids[_cat_supercategories == "patient"],
+        "corridor": _cat_ids[_cat_supercategories == "corridor"],
+    }
 
     @classmethod
-    def get_annotation_catid(cls, name: str) -> int:
-        return cls._annotation_ids[name]
+    def get_catids_by_supercategory(cls, supercategory: str) -> np.ndarray:
+        """Get the (precomputed) array of category ids with the given supercategory."""
+        return cls._catids_by_supercategory[supercategory]
 
-    @classmethod
-    def get_annotation_category(cls, name: int) -> Dict:
-        catid = cls.get_annotation_catid(name)
-        return cls._annotation_from_id[catid]
-
-    @classmethod
-    def get_annotation_name(cls, catid: int) -> str:
-        return cls._annotation_from_id[catid]["name"]
+    # Bound directly to the precomputed dicts to avoid classmethod dispatch in tight loops.
+    get_annotation_catid = staticmethod(_annotation_ids.__getitem__)  # name -> catid
+    get_annotation_category = staticmethod(_annotation_from_name.__getitem__)  # name -> category
+    get_annotation_name = staticmethod(_cat_name_by_id.__getitem__)  # catid -> name
 
     @classmethod
     def get_annotation_pretty_name(cls, catid: int) -> str:
@@ -412,21 +433,53 @@ class PerphixBase:
         },
     ]
 
+    # Intern the category strings so the tuple-keyed lookups below can short-circuit
+    # hashing/equality on string identity.
+    for _cat in seq_categories:
+        _cat["name"] = sys.intern(_cat["name"])
+        _cat["supercategory"] = sys.intern(_cat["supercategory"])
+    del _cat
+
     _seq_category_names = dict(((ann["supercategory"], ann["name"]), ann) for ann in seq_categories)
     _seq_category_ids = dict((ann["id"], ann) for ann in seq_categories)
+    _seq_catid_from_key = dict(
+        ((ann["supercategory"], ann["name"]), ann["id"]) for ann in seq_categories
+    )
+    _seq_cat_by_id = _by_id(seq_categories)
+    _seq_cat_name_by_id = tuple(cat["name"] if cat is not None else None for cat in _seq_cat_by_id)
+    # Maps both the canonical name and its "screw_"-prefixed variant (as found in some
+    # filenames) to the category id, so parsed names need no string cleanup per lookup.
+    _seq_catid_from_raw_name = dict(
+        ((ann["supercategory"], name), ann["id"])
+        for ann in seq_categories
+        for name in (ann["name"], "screw_" + ann["name"])
+    )
 
-    @classmethod
-    def get_sequence_catid(cls, supercategory: str, name: str) -> int:
-        """Have to use the supercategory because there are multiple categories with the same name."""
-        return cls._seq_category_names[(supercategory, name)]["id"]
+    # Structure-of-arrays views over the sequence categories.
+    _seq_cat_ids = np.fromiter((ann["id"] for ann in seq_categories), int)
+    _seq_cat_names = np.array([ann["name"] for ann in seq_categories], dtype=object)
+    _seq_cat_supercategories = np.array(
+        [ann["supercategory"] for ann in seq_categories], dtype=object
+    )
+    _seq_catids_by_supercategory = {
+        "task": _seq_cat_ids[_seq_cat_supercategories == "task"],
+        "activity": _seq_cat_ids[_seq_cat_supercategories == "activity"],
+        "acquisition": _seq_cat_ids[_seq_cat_supercategories == "acquisition"],
+        "frame": _seq_cat_ids[_seq_cat_supercategories == "frame"],
+    }
 
     @classmethod
-    def get_sequence_category(cls, catid: int) -> Dict:
-        return cls._seq_category_ids[catid]
+    def get_seq_catids_by_supercategory(cls, supercategory: str) -> np.ndarray:
+        """Get the (precomputed) array of sequence category ids with the given supercategory."""
+        return cls._seq_catids_by_supercategory[supercategory]
 
     @classmethod
-    def get_sequence_name(cls, catid: int) -> str:
-        return cls._seq_category_ids[catid]["name"]
+    def get_sequence_catid(cls, supercategory: str, name: str) -> int:
+        """Have to use the supercategory because there are multiple categories with the same name."""
+        return cls._seq_catid_from_key[(supercategory, name)]
+
+    get_sequence_category = staticmethod(_seq_cat_by_id.__getitem__)  # catid -> category
+    get_sequence_name = staticmethod(_seq_cat_name_by_id.__getitem__)  # catid -> name
 
     class_categories = [
         {
@@ -488,11 +541,11 @@ class PerphixBase:
     @classmethod
     def remove_keypoints(cls, annotation: Dict[str, Any]) -> Dict[str, Any]:
         """Remove the keypoints from the annotation."""
-        annotation = copy.deepcopy(annotation)
-        for anno in annotation["annotations"]:
-            if "keypoints" in anno:
-                del anno["keypoints"]
-
+        annotation = dict(annotation)
+        annotation["annotations"] = [
+            {k: v for k, v in anno.items() if k != "keypoints"}
+            for anno in annotation["annotations"]
+        ]
         return annotation
 
     @classmethod
@@ -502,11 +555,11 @@ class PerphixBase:
         This is useful for training a model to segment the hips and detect keypoints.
 
         """
-        annotation = copy.deepcopy(annotation)
-        new_annotations = []
-        for anno in annotation["annotations"]:
-            if anno["category_id"] == cls.get_annotation_catid("pelvis"):
-                new_annotations.append(anno)
+        annotation = dict(annotation)
+        pelvis_catid = cls.get_annotation_catid("pelvis")
+        new_annotations = [
+            anno for anno in annotation["annotations"] if anno["category_id"] == pelvis_catid
+        ]
 
         categories = [cat for cat in annotation["categories"] if cat["name"] == "pelvis"]
 
@@ -521,50 +574,31 @@ class PerphixBase:
         This is a convenience function in case image sequences are stored improperly in the
         dictionary.
         """
-        annotation = copy.deepcopy(annotation)
+        annotation = dict(annotation)
+        images = annotation["images"]
 
+        catid_from_raw = cls._seq_catid_from_raw_name
         sequences = []
-        prev_seq_category_names = None
-        seq_lengths = [0, 0, 0, 0]
-        for image in annotation["images"]:
-            image_id = image["id"]
-            seq_category_names = image["file_name"].split(".")[0].split("-")[-4:]
-
-            if prev_seq_category_names is None:
-                prev_seq_category_names = seq_category_names
-                first_frame_ids = [image_id, image_id, image_id, image_id]
-                seq_lengths = [1, 1, 1, 1]
-                continue
-
+        if len(images) > 0:
+            # Parse each filename once into its 4 sequence category names, (N, 4).
+            names = np.array(
+                [image["file_name"].split(".")[0].split("-")[-4:] for image in images],
+                dtype=object,
+            )
             # TODO: figure out why the acquisition sequences are overlapping and fix it.
             for i, supercategory in enumerate(["task", "activity", "acquisition", "frame"]):
-                if seq_category_names[i] != prev_seq_category_names[i]:
-                    seq_category_name = prev_seq_category_names[i].replace("screw_", "")
-                    seq = {
-                        "id": len(sequences),
-                        "first_frame_id": first_frame_ids[i],
-                        "seq_length": seq_lengths[i],
-                        "seq_category_id": cls.get_sequence_catid(supercategory, seq_category_name),
-                    }
-
-                    sequences.append(seq)
-                    first_frame_ids[i] = image_id
-                    seq_lengths[i] = 0
-
-                seq_lengths[i] += 1
-                prev_seq_category_names[i] = seq_category_names[i]
-
-        # Add the last sequence.
-        for i, supercategory in enumerate(["task", "activity", "acquisition", "frame"]):
-            seq_category_name = prev_seq_category_names[i].replace("screw_", "")
-            seq = {
-                "id": len(sequences),
-                "first_frame_id": first_frame_ids[i],
-                "seq_length": seq_lengths[i],
-                "seq_category_id": cls.get_sequence_catid(supercategory, seq_category_name),
-            }
-
-            sequences.append(seq)
+                column = names[:, i]
+                change = np.flatnonzero(column[1:] != column[:-1]) + 1
+                bounds = np.concatenate([[0], change, [len(images)]])
+                for start, end in zip(bounds[:-1], bounds[1:]):
+                    sequences.append(
+                        {
+                            "id": len(sequences),
+                            "first_frame_id": images[start]["id"],
+                            "seq_length": int(end - start),
+                            "seq_category_id": catid_from_raw[(supercategory, column[start])],
+                        }
+                    )
 
         annotation["sequences"] = sequences
         return annotation
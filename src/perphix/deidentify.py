@@ -1,5 +1,7 @@
 from pathlib import Path
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import pydicom
 from pydicom.errors import InvalidDicomError
 import random
@@ -50,58 +52,114 @@ def remove_age(ds: pydicom.Dataset):
     ds[0x00101010].value = age
 
 
-def deidentify_dataset(ds: pydicom.Dataset, case_id: str = "") -> pydicom.Dataset:
+# Tags blanked wholesale during deidentification. The patient name/ID tags are handled
+# separately, since they are replaced with the case ID rather than cleared.
+_TAGS_TO_CLEAR = (
+    0x00080014,  # Instance creator UID
+    0x00080018,  # SOP Instance UID
+    0x00080050,  # Accession Number
+    0x00080081,  # Institution Address
+    0x00080090,  # Referring Physician's Name
+    0x00080092,  # Referring Physician's Address
+    0x00080094,  # Referring Physician's Telephone Numbers
+    0x00081030,  # Study Description
+    0x0008103E,  # Series Description
+    0x00081048,  # Physician(s) of Record
+    0x00081050,  # Performing Physician's Name
+    0x00081060,  # Name of Physician(s) Reading Study
+    0x00081070,  # Operator's Name
+    0x00081080,  # Admitting Diagnoses Description
+    0x00081155,  # Referenced SOP Instance UID
+    0x00082111,  # Derivation Description
+    0x00100030,  # Patient's Birth Date
+    0x00100032,  # Patient's Birth Time
+    0x00101000,  # Other Patient IDs
+    0x00101001,  # Other Patient Names
+    0x00101010,  # Patient's Age
+    0x00101020,  # Patient's Size
+    0x00101030,  # Patient's Weight
+    0x00101090,  # Medical Record Locator
+    0x00102160,  # Ethnic Group
+    0x00102180,  # Occupation
+    0x001021B0,  # Additional Patient History
+    0x00104000,  # Patient Comments
+    0x0020000D,  # Study Instance UID
+    0x0020000E,  # Series Instance UID
+    0x00200010,  # Study ID
+    0x00200052,  # Frame of Reference UID
+    0x00200200,  # Synchronization Frame of Reference UID
+    0x00204000,  # Image Comments
+)
+
+
+def deidentify_dataset(
+    ds: pydicom.Dataset, case_id: str = "", inplace: bool = False
+) -> pydicom.Dataset:
     """Remove patient identifiable information from a DICOM dataset.
 
     Args:
         ds (pydicom.dataset.Dataset): Input DICOM dataset
         case (str, optional): Case ID. This is used as the new patient identifier. Defaults to "".
+        inplace (bool, optional): Mutate `ds` directly rather than deep-copying it first. Callers
+            that just read the dataset from disk should pass True to skip the copy. Defaults to
+            False.
 
     Returns:
         pydicom.dataset.Dataset: Deidentified DICOM dataset
 
     """
-    ds = deepcopy(ds)
-
-    remove_tag(ds, 0x00080014)  # Instance creator UID
-    remove_tag(ds, 0x00080018)  # SOP Instance UID
-    remove_tag(ds, 0x00080050)  # Accession Number
-    remove_tag(ds, 0x00080081)  # Institution Address
-    remove_tag(ds, 0x00080090)  # Referring Physician's Name
-    remove_tag(ds, 0x00080092)  # Referring Physician's Address
-    remove_tag(ds, 0x00080094)  # Referring Physician's Telephone Numbers
-    remove_tag(ds, 0x00081030)  # Study Description
-    remove_tag(ds, 0x0008103E)  # Series Description
-    remove_tag(ds, 0x00081048)  # Physician(s) of Record
-    remove_tag(ds, 0x00081050)  # Performing Physician's Name
-    remove_tag(ds, 0x00081060)  # Name of Physician(s) Reading Study
-    remove_tag(ds, 0x00081070)  # Operator's Name
-    remove_tag(ds, 0x00081080)  # Admitting Diagnoses Description
-    remove_tag(ds, 0x00081155)  # Referenced SOP Instance UID
-    remove_tag(ds, 0x00082111)  # Derivation Description
-    remove_tag(ds, 0x00100010, case_id)  # Patient's Name
-    remove_tag(ds, 0x00100020, case_id)  # Patient ID
-    remove_tag(ds, 0x00100030)  # Patient's Birth Date
-    remove_tag(ds, 0x00100032)  # Patient's Birth Time
-    remove_tag(ds, 0x00101000)  # Other Patient IDs
-    remove_tag(ds, 0x00101001)  # Other Patient Names
-    remove_tag(ds, 0x00101010)  # Patient's Age
-    remove_tag(ds, 0x00101020)  # Patient's Size
-    remove_tag(ds, 0x00101030)  # Patient's Weight
-    remove_tag(ds, 0x00101090)  # Medical Record Locator
-    remove_tag(ds, 0x00102160)  # Ethnic Group
-    remove_tag(ds, 0x00102180)  # Occupation
-    remove_tag(ds, 0x001021B0)  # Additional Patient History
-    remove_tag(ds, 0x00104000)  # Patient Comments
-    remove_tag(ds, 0x0020000D)  # Study Instance UID
-    remove_tag(ds, 0x0020000E)  # Series Instance UID
-    remove_tag(ds, 0x00200010)  # Study ID
-    remove_tag(ds, 0x00200052)  # Frame of Reference UID
-    remove_tag(ds, 0x00200200)  # Synchronization Frame of Reference UID
-    remove_tag(ds, 0x00204000)  # Image Comments
+    if not inplace:
+        ds = deepcopy(ds)
+
+    for tag in _TAGS_TO_CLEAR:
+        el = ds.get(tag)
+        if el is not None:
+            el.value = ""
+
+    el = ds.get(0x00100010)  # Patient's Name
+    if el is not None:
+        el.value = case_id
+    el = ds.get(0x00100020)  # Patient ID
+    if el is not None:
+        el.value = case_id
+
     return ds
 
 
+def _read_and_deidentify(path: Path, case_id: str) -> Optional[tuple[str, pydicom.Dataset]]:
+    """Read one DICOM file and deidentify it, or return None if it should be skipped."""
+    if not path.is_file():
+        return None
+    try:
+        # Defer large elements (pixel data); deidentification only touches small metadata,
+        # and save_as streams deferred elements from the source file on write.
+        ds = pydicom.dcmread(str(path), defer_size="4 KB")
+    except InvalidDicomError:
+        return None
+    acquisition_time = str(ds.AcquisitionTime)
+    # Skip the dose report
+    if "protocol" in str(ds.SeriesDescription).lower():
+        log.info(f"Skipping exam protocol: {ds.SeriesDescription}")
+        return None
+    if ds.Modality not in ["CT", "MR", "DX", "CR", "XA"]:
+        log.info(f"Skipping image with modality {ds.Modality}")
+        return None
+    ds = deidentify_dataset(ds, case_id, inplace=True)
+    return acquisition_time, ds
+
+
+def _write_dataset(output_dir: Path, item: tuple[int, pydicom.Dataset]):
+    """Write one deidentified dataset with its new series index."""
+    new_series_id, ds = item
+    ds.SeriesInstanceUID = str(new_series_id)
+    ds.save_as(str(output_dir / f"{new_series_id:06d}.dcm"))
+
+    # For debugging
+    # image = np.array(ds.pixel_array).astype(np.float32) / (2**16 - 1)
+    # image = (image * 255).astype(np.uint8)
+    # Image.fromarray(image).save(output_dir / f"{new_series_id:06d}.png")
+
+
 def deidentify(input_dir: Path, output_dir: Path, case_id: Optional[str] = None):
     """Remove patient identifiable information from DICOM files, recursively.
 
@@ -126,34 +184,28 @@ def deidentify(input_dir: Path, output_dir: Path, case_id: Optional[str] = None)
     if not output_dir.exists():
         output_dir.mkdir(parents=True)
 
+    # Each file is independent, so overlap the reads/writes across a thread pool.
     paths = list(input_dir.rglob("*"))
-    datasets: list[tuple[str, pydicom.Dataset]] = []
-    for path in track(paths, description="Deidentifying DICOM files"):
-        if not path.is_file():
-            continue
-        try:
-            ds = pydicom.dcmread(str(path))
-        except InvalidDicomError:
-            continue
-        acquisition_time = str(ds.AcquisitionTime)
-        # Skip the dose report
-        if "protocol" in str(ds.SeriesDescription).lower():
-            log.info(f"Skipping exam protocol: {ds.SeriesDescription}")
-            continue
-        if ds.Modality not in ["CT", "MR", "DX", "CR", "XA"]:
-            log.info(f"Skipping image with modality {ds.Modality}")
-            continue
-        ds = deidentify_dataset(ds, case_id)
-        datasets.append((acquisition_time, ds))
+    with ThreadPoolExecutor() as executor:
+        results = list(
+            track(
+                executor.map(partial(_read_and_deidentify, case_id=case_id), paths),
+                description="Deidentifying DICOM files",
+                total=len(paths),
+            )
+        )
+    datasets = [result for result in results if result is not None]
 
     datasets = sorted(datasets, key=lambda x: x[0])
     log.info(f"Found {len(datasets)} DICOM files")
-    for i, (_, ds) in enumerate(track(datasets, description="Writing DICOM files")):
-        new_series_id = i
-        ds.SeriesInstanceUID = str(new_series_id)
-        ds.save_as(str(output_dir / f"{new_series_id:06d}.dcm"))
-
-        # For debugging
-        # image = np.array(ds.pixel_array).astype(np.float32) / (2**16 - 1)
-        # image = (image * 255).astype(np.uint8)
-        # Image.fromarray(image).save(output_dir / f"{i:06d}.png")
+    with ThreadPoolExecutor() as executor:
+        list(
+            track(
+                executor.map(
+                    partial(_write_dataset, output_dir),
+                    [(i, ds) for i, (_, ds) in enumerate(datasets)],
+                ),
+                description="Writing DICOM files",
+                total=len(datasets),
+            )
+        )
@@ -3,9 +3,17 @@ from pathlib import Path
 import pydicom
 from pydicom.errors import InvalidDicomError
 from typing import Generator
+import math
 import numpy as np
 import json
 
+try:
+    from numba import njit, prange
+
+    _numba_available = True
+except ImportError:
+    _numba_available = False
+
 
 def get_dicom_paths(input_dir: Path) -> Generator[Path, None, None]:
     """Recursively yield all DICOM files in a directory.
@@ -20,13 +28,49 @@ def get_dicom_paths(input_dir: Path) -> Generator[Path, None, None]:
         if f.is_dir():
             yield from get_dicom_paths(f)
         elif f.is_file():
+            # Check the 128-byte preamble + "DICM" magic rather than parsing the whole
+            # file. Fall back to a header-only parse for DICOMs written without a preamble.
+            with f.open("rb") as fh:
+                head = fh.read(132)
+            if len(head) == 132 and head[128:132] == b"DICM":
+                yield f
+                continue
             try:
-                ds = pydicom.dcmread(f)
+                pydicom.dcmread(f, stop_before_pixels=True, specific_tags=[])
             except InvalidDicomError:
                 continue
             yield f
 
 
+_ARANGE_CACHE: dict[int, np.ndarray] = {}
+
+
+def _arange(n: int) -> np.ndarray:
+    """Get a cached, read-only float32 arange of length `n`.
+
+    Heatmaps in a given pipeline are nearly always the same size, so the base
+    vectors are memoized rather than re-allocated on every call.
+    """
+    arr = _ARANGE_CACHE.get(n)
+    if arr is None:
+        arr = np.arange(n, dtype=np.float32)
+        arr.setflags(write=False)
+        _ARANGE_CACHE[n] = arr
+    return arr
+
+
+if _numba_available:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _heatmap_kernel(x: float, y: float, inv: float, H: int, W: int, out: np.ndarray):
+        for i in prange(H):
+            dy = i - y
+            dy2 = dy * dy
+            for j in range(W):
+                dx = j - x
+                out[i, j] = math.exp(inv * (dx * dx + dy2))
+
+
 def heatmap(x: float, y: float, scale: float, size: tuple[int, int]) -> np.ndarray:
     """Create a heatmap for a point in the image.
 
@@ -40,14 +84,19 @@ def heatmap(x: float, y: float, scale: float, size: tuple[int, int]) -> np.ndarr
         np.ndarray: Heatmap
     """
     H, W = size
-    xs, ys = np.meshgrid(
-        np.arange(H, dtype=np.float32), np.arange(W, dtype=np.float32), indexing="xy"
-    )
-    xdiff = xs - x
-    ydiff = ys - y
-    distance_squared = np.square(xdiff) + np.square(ydiff)
-    h = np.exp(-distance_squared / (2 * scale * scale))
-    return h.astype(np.float32)
+    inv = -0.5 / (scale * scale)
+    h = np.empty((H, W), dtype=np.float32)
+    if _numba_available:
+        _heatmap_kernel(x, y, inv, H, W, h)
+        return h
+    dx = _arange(W) - x
+    dx *= dx
+    dy = _arange(H) - y
+    dy *= dy
+    np.add(dy[:, None], dx[None, :], out=h)
+    h *= inv
+    np.exp(h, out=h)
+    return h
 
 
 def jsonable(obj: Any):
@@ -1,4 +1,6 @@
 from typing import List
+from dataclasses import dataclass
+import functools
 import logging
 import numpy as np
 import cv2
@@ -6,9 +8,161 @@ from typing import Optional
 import seaborn as sns
 from deepdrr.utils.image_utils import ensure_cdim, as_uint8, as_float32
 
+try:
+    from numba import njit, prange
+
+    _numba_available = True
+except ImportError:
+    _numba_available = False
+
 
 log = logging.getLogger(__name__)
 
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+@dataclass(frozen=True)
+class DrawStyle:
+    """Resolution-dependent drawing constants.
+
+    Every draw_* function derives these from the image height; callers composing several
+    overlays on the same frame can compute the style once and pass it to each call.
+    """
+
+    fontscale: float
+    thickness: int
+    offset: int
+    radius: int
+
+    @classmethod
+    def from_image(cls, image: np.ndarray) -> "DrawStyle":
+        """Get the style for an image, scaled relative to a 512-pixel-tall reference."""
+        h = image.shape[0]
+        return cls(
+            fontscale=0.75 / 512 * h,
+            thickness=max(int(1 / 256 * h), 1),
+            offset=max(5, int(5 / 512 * h)),
+            radius=max(1, int(5 / 512 * h)),
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _disk(radius: int) -> np.ndarray:
+    """Get a boolean (2r+1, 2r+1) disk stamp for marking keypoints."""
+    ij = np.arange(-radius, radius + 1)
+    return ij[:, None] ** 2 + ij[None, :] ** 2 <= radius * radius
+
+
+@functools.lru_cache(maxsize=8)
+def _disk_offsets(radius: int) -> np.ndarray:
+    """Get the (K, 2) int32 array of (dx, dy) offsets inside the disk of the given radius."""
+    ys, xs = np.nonzero(_disk(radius))
+    offsets = np.stack([xs - radius, ys - radius], axis=1).astype(np.int32)
+    offsets.setflags(write=False)
+    return offsets
+
+
+if _numba_available:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _combine_heatmap_kernel(
+        image_arr: np.ndarray,
+        heatmap_arr: np.ndarray,
+        channel: int,
+        heat_mins: np.ndarray,
+        heat_ranges: np.ndarray,
+    ):
+        C, H, W = heatmap_arr.shape
+        for h in prange(H):
+            for w in range(W):
+                s = np.float32(0.0)
+                for c in range(C):
+                    s += (heatmap_arr[c, h, w] - heat_mins[c]) / heat_ranges[c]
+                for rgb in range(image_arr.shape[0]):
+                    value = image_arr[rgb, h, w] * (1 - s)
+                    if rgb == channel:
+                        value += s
+                    image_arr[rgb, h, w] = value
+
+    @njit(cache=True, parallel=True)
+    def _stamp_keypoints(
+        image: np.ndarray, keypoints: np.ndarray, colors: np.ndarray, offsets: np.ndarray
+    ):
+        H, W = image.shape[:2]
+        for i in prange(keypoints.shape[0]):
+            for k in range(offsets.shape[0]):
+                x = keypoints[i, 0] + offsets[k, 0]
+                y = keypoints[i, 1] + offsets[k, 1]
+                if 0 <= x < W and 0 <= y < H:
+                    for c in range(image.shape[2]):
+                        image[y, x, c] = colors[i, c]
+
+
+@functools.lru_cache(maxsize=64)
+def _palette(palette: str, n: int) -> np.ndarray:
+    """Get an (n, 3) uint8 color palette, scaled to [0, 255].
+
+    seaborn rebuilds the palette through matplotlib on every call, so the result is cached
+    and returned read-only; copy before shuffling or mutating.
+    """
+    colors = (np.array(sns.color_palette(palette, n)) * 255).astype(np.uint8)
+    colors.setflags(write=False)
+    return colors
+
+
+@functools.lru_cache(maxsize=64)
+def _permuted_palette(palette: str, n: int, seed: int) -> np.ndarray:
+    """Get the cached palette shuffled with the given seed, read-only."""
+    colors = _palette(palette, n)[np.random.RandomState(seed).permutation(n)]
+    colors.setflags(write=False)
+    return colors
+
+
+@functools.lru_cache(maxsize=64)
+def _prepare_colors_cached(
+    palette: str, n: int, seed: Optional[int]
+) -> tuple[np.ndarray, np.ndarray, list]:
+    colors_uint8 = _palette(palette, n) if seed is None else _permuted_palette(palette, n, seed)
+    colors_float = colors_uint8.astype(np.float32) / 255
+    colors_float.setflags(write=False)
+    color_tuples = [tuple(int(c) for c in row) for row in colors_uint8]
+    return colors_float, colors_uint8, color_tuples
+
+
+def _scale_colors(
+    colors: np.ndarray, colors_in_01: Optional[bool] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get float [0, 1] and uint8 forms of caller-provided colors.
+
+    `colors_in_01` declares the input range explicitly; when None, a float dtype is
+    taken to mean [0, 1] and an integer dtype to mean [0, 255].
+    """
+    colors = np.asarray(colors)
+    if colors_in_01 is None:
+        colors_in_01 = colors.dtype.kind == "f"
+    if colors_in_01:
+        colors_float = np.asarray(colors, dtype=np.float32)
+        colors_uint8 = (colors_float * 255).astype(np.uint8)
+    else:
+        colors_uint8 = colors.astype(np.uint8)
+        colors_float = colors_uint8.astype(np.float32) / 255
+    return colors_float, colors_uint8
+
+
+def _prepare_colors(
+    palette: str, n: int, seed: Optional[int]
+) -> tuple[np.ndarray, np.ndarray, list]:
+    """Get float [0, 1], uint8, and OpenCV-tuple forms of the (optionally shuffled) palette.
+
+    With a seed all three forms come straight from the cache; without one, a fresh
+    permutation is drawn from the global RNG as before.
+    """
+    colors_float, colors_uint8, color_tuples = _prepare_colors_cached(palette, n, seed)
+    if seed is None:
+        perm = np.random.permutation(n)
+        return colors_float[perm], colors_uint8[perm], [color_tuples[j] for j in perm]
+    return colors_float, colors_uint8, color_tuples
+
 
 # TODO: redo each of these to allow for passing in a color palette and labels, as well as a scale
 # factor.
@@ -18,23 +172,24 @@ def stack(images: list[np.ndarray], axis: int = 0):
     """Stack a list of images into a single image."""
     pad_axis = 1 - axis
 
-    # Get the biggest image along the pad_axis
-    max_size = np.max([image.shape[pad_axis] for image in images])
-
-    # Pad on the other axis to make all images the same size
-    images = [
-        np.pad(
-            image,
-            [(0, 0)] * pad_axis
-            + [(0, max_size - image.shape[pad_axis])]
-            + [(0, 0)] * (2 - pad_axis),
-        )
-        for image in images
-    ]
     log.debug(f"Stacking images with shapes {[image.shape for image in images]} along {axis}")
 
-    # Stack the images
-    return np.concatenate(images, axis=axis)
+    # Write each image straight into a single zero-initialized output, instead of
+    # allocating a padded copy per image and concatenating. The zeros provide the padding.
+    shape = list(images[0].shape)
+    shape[axis] = sum(image.shape[axis] for image in images)
+    shape[pad_axis] = max(image.shape[pad_axis] for image in images)
+    out = np.zeros(shape, dtype=images[0].dtype)
+
+    offset = 0
+    for image in images:
+        index = [slice(None)] * out.ndim
+        index[axis] = slice(offset, offset + image.shape[axis])
+        index[pad_axis] = slice(0, image.shape[pad_axis])
+        out[tuple(index)] = image
+        offset += image.shape[axis]
+
+    return out
 
 
 def combine_heatmap(
@@ -65,20 +220,39 @@ def combine_heatmap(
         heatmap_arr = heatmap_arr.astype(np.float32)
         seg = True
 
-    _, h, w = heatmap_arr.shape
-    heat_sum = np.zeros((h, w), dtype=np.float32)
-    for heat in heatmap_arr:
-        heat_min = heat.min()
-        heat_max = 4 if seg else heat.max()
-        heat_min_minus_max = heat_max - heat_min
-        heat = heat - heat_min
-        if heat_min_minus_max > 1.0e-3:
-            heat /= heat_min_minus_max
-
-        heat_sum += heat
+    if normalize:
+        # Normalize every channel at once with axis-wise reductions rather than a Python loop.
+        heat_min = heatmap_arr.min(axis=(1, 2), keepdims=True)
+        if seg:
+            heat_max = np.full_like(heat_min, 4)
+        else:
+            heat_max = heatmap_arr.max(axis=(1, 2), keepdims=True)
+        denom = heat_max - heat_min
+    else:
+        # Caller vouches the heatmaps are already in [0, 1]; skip the reductions.
+        heat_min = np.zeros((heatmap_arr.shape[0], 1, 1), dtype=np.float32)
+        denom = np.ones_like(heat_min)
+
+    if _numba_available:
+        # Fuse the normalize + accumulate + blend into a single jitted pass over the
+        # pixels, with the near-constant-channel guard folded into the range vector.
+        image_arr = np.ascontiguousarray(image_arr, dtype=np.float32)
+        heat_ranges = np.where(denom > 1.0e-3, denom, 1.0).astype(np.float32).ravel()
+        _combine_heatmap_kernel(
+            image_arr,
+            np.ascontiguousarray(heatmap_arr, dtype=np.float32),
+            channel,
+            heat_min.astype(np.float32).ravel(),
+            heat_ranges,
+        )
+    else:
+        heat_norm = heatmap_arr - heat_min
+        np.divide(heat_norm, denom, out=heat_norm, where=denom > 1.0e-3)
+        heat_sum = heat_norm.sum(axis=0, dtype=np.float32)
 
-    for c in range(3):
-        image_arr[c] = ((1 - heat_sum) * image_arr[c]) + (heat_sum if c == channel else 0)
+        # Attenuate all channels in one broadcast, then add the heat into the chosen channel.
+        image_arr *= 1 - heat_sum
+        image_arr[channel] += heat_sum
 
     # log.debug(f"Combined heatmap with shape {image_arr.shape} and dtype {image_arr.dtype}")
 
@@ -92,22 +266,34 @@ def draw_corridor(
     thickness: int = 1,
     palette: str = "hls",
     name: Optional[str] = None,
+    colors_in_01: Optional[bool] = None,
+    style: Optional[DrawStyle] = None,
+    inplace: bool = False,
 ):
     """Draw a corridor on an image (copy).
 
     Args:
         image (np.ndarray): the image to draw on.
         corridor (np.ndarray): the corridor to draw. [2, 2] array of [x, y] coordinates.
+        colors_in_01 (bool, optional): whether `color` is in [0, 1] rather than [0, 255].
+            When None, inferred from the dtype. Defaults to None.
+        style (DrawStyle, optional): precomputed drawing constants for this image size.
+            Computed from the image when None. Defaults to None.
+        inplace (bool, optional): draw directly on the input buffer. Defaults to False.
 
     """
 
-    image = draw_keypoints(image, corridor, names=["0", "1"], palette=palette)
+    if style is None:
+        style = DrawStyle.from_image(image)
 
-    if color is None:
-        color = np.array(sns.color_palette(palette, 1))[0]
+    image = draw_keypoints(
+        image, corridor, names=["0", "1"], palette=palette, style=style, inplace=inplace
+    )
 
-    if np.any(color < 1):
-        color = (color * 255).astype(int)
+    if color is None:
+        color = _palette(palette, 1)[0]
+    else:
+        _, color = _scale_colors(color, colors_in_01)
 
     color = np.array(color).tolist()
     log.debug(f"Drawing corridor with color: {color}")
@@ -123,18 +309,15 @@ def draw_corridor(
 
     # Draw the name of the corridor
     if name is not None:
-        fontscale = 0.75 / 512 * image.shape[0]
-        thickness = max(int(1 / 256 * image.shape[0]), 1)
-        offset = max(5, int(5 / 512 * image.shape[0]))
         x, y = np.mean(corridor, axis=0)
         image = cv2.putText(
             image,
             name,
-            (int(x) + offset, int(y) - offset),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            fontscale,
+            (int(x) + style.offset, int(y) - style.offset),
+            _FONT,
+            style.fontscale,
             color,
-            thickness,
+            style.thickness,
             cv2.LINE_AA,
         )
 
@@ -148,6 +331,9 @@ def draw_keypoints(
     colors: Optional[np.ndarray] = None,
     palette: str = "hls",
     seed: Optional[int] = None,
+    colors_in_01: Optional[bool] = None,
+    style: Optional[DrawStyle] = None,
+    inplace: bool = False,
 ) -> np.ndarray:
     """Draw keypoints on an image (copy).
 
@@ -157,6 +343,12 @@ def draw_keypoints(
             -1 indicates no keypoint present.
         names (List[str], optional): the names of the keypoints. Defaults to None.
         colors (np.ndarray, optional): the colors to use for each keypoint. Defaults to None.
+        colors_in_01 (bool, optional): whether `colors` are in [0, 1] rather than [0, 255].
+            When None, inferred from the dtype. Defaults to None.
+        style (DrawStyle, optional): precomputed drawing constants for this image size.
+            Computed from the image when None. Defaults to None.
+        inplace (bool, optional): draw directly on the input buffer (must already be a
+            contiguous uint8 color image to avoid a conversion copy). Defaults to False.
 
     Returns:
         np.ndarray: the image with the keypoints drawn.
@@ -166,39 +358,138 @@ def draw_keypoints(
     if len(keypoints) == 0:
         return image
 
-    image = ensure_cdim(as_uint8(image)).copy()
+    image_arr = ensure_cdim(as_uint8(image))
+    if not inplace and np.shares_memory(image_arr, image):
+        image_arr = image_arr.copy()
+    image = image_arr
     keypoints = np.array(keypoints)
     if colors is None:
-        colors = np.array(sns.color_palette(palette, keypoints.shape[0]))
-        if seed is not None:
-            np.random.seed(seed)
-        colors = colors[np.random.permutation(colors.shape[0])]
+        _, colors, color_tuples = _prepare_colors(palette, keypoints.shape[0], seed)
+    else:
+        _, colors = _scale_colors(colors, colors_in_01)
+        color_tuples = [tuple(int(c) for c in row) for row in colors]
 
-    if np.any(colors < 1):
-        colors = (colors * 255).astype(int)
+    if style is None:
+        style = DrawStyle.from_image(image)
 
-    fontscale = 0.75 / 512 * image.shape[0]
-    thickness = max(int(1 / 256 * image.shape[0]), 1)
-    offset = max(5, int(5 / 512 * image.shape[0]))
-    radius = max(1, int(5 / 512 * image.shape[0]))
+    valid = (keypoints >= 0).all(axis=1)
 
-    for i, keypoint in enumerate(keypoints):
-        if np.any(keypoint < 0):
-            continue
-        color = colors[i].tolist()
-        x, y = keypoint
-        image = cv2.circle(image, (int(x), int(y)), radius, color, -1)
-        if names is not None:
+    # Rasterize all markers in one jitted pass over a precomputed disk offset table,
+    # falling back to numpy slice-stamping per point when numba is unavailable.
+    if _numba_available and valid.any():
+        _stamp_keypoints(
+            image,
+            keypoints[valid].astype(np.int32),
+            colors[valid].astype(np.uint8),
+            _disk_offsets(style.radius),
+        )
+    else:
+        radius = style.radius
+        disk = _disk(radius)
+        H, W = image.shape[:2]
+        for i in np.flatnonzero(valid):
+            x, y = int(keypoints[i, 0]), int(keypoints[i, 1])
+            y0, y1 = max(y - radius, 0), min(y + radius + 1, H)
+            x0, x1 = max(x - radius, 0), min(x + radius + 1, W)
+            if y0 >= y1 or x0 >= x1:
+                continue
+            stamp = disk[
+                y0 - (y - radius) : y1 - (y - radius), x0 - (x - radius) : x1 - (x - radius)
+            ]
+            image[y0:y1, x0:x1][stamp] = colors[i]
+
+    if names is not None:
+        for i in np.flatnonzero(valid):
+            x, y = int(keypoints[i, 0]), int(keypoints[i, 1])
+            image = cv2.putText(
+                image,
+                names[i],
+                (x + style.offset, y - style.offset),
+                _FONT,
+                style.fontscale,
+                color_tuples[i],
+                style.thickness,
+                cv2.LINE_AA,
+            )
+    return image
+
+
+def draw_boxes(
+    image: np.ndarray,
+    boxes: np.ndarray,
+    names: Optional[List[str]] = None,
+    colors: Optional[np.ndarray] = None,
+    palette: str = "hls",
+    seed: Optional[int] = None,
+    colors_in_01: Optional[bool] = None,
+    style: Optional[DrawStyle] = None,
+    thickness: int = 1,
+    inplace: bool = False,
+) -> np.ndarray:
+    """Draw bounding boxes on an image (copy).
+
+    Args:
+        image (np.ndarray): the image to draw on.
+        boxes (np.ndarray): the boxes to draw. [N, 4] array in COCO (x, y, w, h) form.
+        names (List[str], optional): the names of the boxes. Defaults to None.
+        colors (np.ndarray, optional): the colors to use for each box. Defaults to None.
+        colors_in_01 (bool, optional): whether `colors` are in [0, 1] rather than [0, 255].
+            When None, inferred from the dtype. Defaults to None.
+        style (DrawStyle, optional): precomputed drawing constants for this image size.
+            Computed from the image when None. Defaults to None.
+        inplace (bool, optional): draw directly on the input buffer. Defaults to False.
+
+    Returns:
+        np.ndarray: the image with the boxes drawn.
+
+    """
+
+    boxes = np.array(boxes)
+    if len(boxes) == 0:
+        return image
+
+    image_arr = ensure_cdim(as_uint8(image))
+    if not inplace and np.shares_memory(image_arr, image):
+        image_arr = image_arr.copy()
+    image = image_arr
+
+    if colors is None:
+        _, _, color_tuples = _prepare_colors(palette, boxes.shape[0], seed)
+    else:
+        _, colors = _scale_colors(colors, colors_in_01)
+        color_tuples = [tuple(int(c) for c in row) for row in colors]
+
+    # Do all the coordinate math up front; the loops only issue drawing primitives.
+    corners = np.empty((boxes.shape[0], 4), dtype=np.int32)
+    corners[:, :2] = boxes[:, :2]
+    corners[:, 2:] = boxes[:, :2] + boxes[:, 2:]
+    centers = (corners[:, :2] + corners[:, 2:]) // 2
+
+    if style is None:
+        style = DrawStyle.from_image(image)
+
+    for i in range(corners.shape[0]):
+        image = cv2.rectangle(
+            image,
+            (corners[i, 0], corners[i, 1]),
+            (corners[i, 2], corners[i, 3]),
+            color_tuples[i],
+            thickness,
+        )
+
+    if names is not None:
+        for i in range(corners.shape[0]):
             image = cv2.putText(
                 image,
                 names[i],
-                (int(x) + offset, int(y) - offset),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                fontscale,
-                color,
-                thickness,
+                (int(centers[i, 0]) + style.offset, int(centers[i, 1]) - style.offset),
+                _FONT,
+                style.fontscale,
+                color_tuples[i],
+                style.thickness,
                 cv2.LINE_AA,
             )
+
     return image
 
 
@@ -211,56 +502,99 @@ def draw_masks(
     colors: Optional[np.ndarray] = None,
     palette: str = "hls",
     seed: Optional[int] = None,
+    colors_in_01: Optional[bool] = None,
+    style: Optional[DrawStyle] = None,
+    inplace: bool = False,
 ) -> np.ndarray:
     """Draw contours of masks on an image (copy).
 
     Args:
         image (np.ndarray): the image to draw on.
         masks (np.ndarray): the masks to draw. [num_masks, H, W] array of masks.
+        colors_in_01 (bool, optional): whether `colors` are in [0, 1] rather than [0, 255].
+            When None, inferred from the dtype. Defaults to None.
+        style (DrawStyle, optional): precomputed drawing constants for this image size.
+            Computed from the image when None. Defaults to None.
+        inplace (bool, optional): blend directly into the input buffer (must already be a
+            contiguous float32 color image to avoid a conversion copy). Defaults to False.
     """
 
-    image = as_float32(image)
-    image = ensure_cdim(image)
+    image_arr = ensure_cdim(as_float32(image))
+    if not inplace and np.shares_memory(image_arr, image):
+        image_arr = image_arr.copy()
+    image = image_arr
     if colors is None:
-        colors = np.array(sns.color_palette(palette, masks.shape[0]))
-        if seed is not None:
-            np.random.seed(seed)
-        colors = colors[np.random.permutation(colors.shape[0])]
-
+        colors, colors_uint8, color_tuples = _prepare_colors(palette, masks.shape[0], seed)
+    else:
+        colors, colors_uint8 = _scale_colors(colors, colors_in_01)
+        color_tuples = [tuple(int(c) for c in row) for row in colors_uint8]
+
+    # Blend in float32 throughout, saving the contours, then draw them all on a single
+    # uint8 copy at the end, rather than round-tripping the image once per mask.
+    # Each mask blends the whole frame with cv2.addWeighted (SIMD) into a reused buffer
+    # and copies only the masked pixels back, instead of gather/scatter fancy indexing.
     image *= 1 - alpha
-    for i, mask in enumerate(masks):
-        bool_mask = mask > threshold
+    image = np.ascontiguousarray(image, dtype=np.float32)
+    bool_masks = masks > threshold
+    # One float32 color table up front, so the per-mask tint fill is a plain broadcast
+    # copy with no dtype conversion inside the loop.
+    colors = np.ascontiguousarray(colors, dtype=np.float32)
+    tint = np.empty_like(image)
+    blended = np.empty_like(image)
+    all_contours = []
+    # Row/column occupancy for every mask at once, so each contour scan can be
+    # restricted to its mask's bounding box instead of the full frame.
+    rows_any = bool_masks.any(axis=2)
+    cols_any = bool_masks.any(axis=1)
+    for i, bool_mask in enumerate(bool_masks):
+        # Empty masks are common in detection output; check the precomputed row
+        # occupancy first so they skip the full-frame blend as well as the contours.
+        ys = np.flatnonzero(rows_any[i])
+        if ys.size == 0:
+            all_contours.append(())
+            continue
 
-        image[bool_mask] = colors[i] * alpha + image[bool_mask] * (1 - alpha)
+        tint[:] = colors[i]
+        cv2.addWeighted(image, 1 - alpha, tint, alpha, 0, dst=blended)
+        cv2.copyTo(blended, bool_mask.view(np.uint8), image)
 
+        xs = np.flatnonzero(cols_any[i])
+        y0, y1 = ys[0], ys[-1]
+        x0, x1 = xs[0], xs[-1]
+        # Contour work now scales with the object size, not the image size; the offset
+        # puts the returned points back in full-image coordinates.
         contours, _ = cv2.findContours(
-            bool_mask.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            np.ascontiguousarray(bool_mask[y0 : y1 + 1, x0 : x1 + 1].view(np.uint8)),
+            cv2.RETR_EXTERNAL,
+            cv2.CHAIN_APPROX_SIMPLE,
+            offset=(int(x0), int(y0)),
         )
-        image = as_uint8(image)
-        cv2.drawContours(image, contours, -1, (255 * colors[i]).tolist(), 1)
-        image = as_float32(image)
+        all_contours.append(contours)
 
     image = as_uint8(image)
+    for i, contours in enumerate(all_contours):
+        cv2.drawContours(image, contours, -1, color_tuples[i], 1)
 
-    fontscale = 0.75 / 512 * image.shape[0]
-    thickness = max(int(1 / 256 * image.shape[0]), 1)
+    if style is None:
+        style = DrawStyle.from_image(image)
 
     if names is not None:
-        for i, mask in enumerate(masks):
-            bool_mask = mask > threshold
-            ys, xs = np.argwhere(bool_mask).T
-            if len(ys) == 0:
+        # The external contours already contain each mask's extremes, so the label
+        # position comes from a boundingRect over those few points rather than
+        # re-reducing the full mask stack.
+        for i, contours in enumerate(all_contours):
+            if len(contours) == 0:
                 continue
-            y = (np.min(ys) + np.max(ys)) / 2
-            x = (np.min(xs) + np.max(xs)) / 2
+            points = contours[0] if len(contours) == 1 else np.concatenate(contours)
+            x, y, w, h = cv2.boundingRect(points)
             image = cv2.putText(
                 image,
                 names[i],
-                (int(x) + 5, int(y) - 5),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                fontscale,
-                (255 * colors[i]).tolist(),
-                thickness,
+                (int(x + (w - 1) / 2) + 5, int(y + (h - 1) / 2) - 5),
+                _FONT,
+                style.fontscale,
+                color_tuples[i],
+                style.thickness,
                 cv2.LINE_AA,
             )
 